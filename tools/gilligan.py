@@ -26,7 +26,8 @@ Commands:
     validate                        Validate ABC without staging
     workflow                        Full workflow: validate → stage
     songs                           List available songs
-    song <name>                     Load song on all tracks (with retry)
+    song <name>                     Load song on all tracks
+    daemon                          Serve commands over a Unix socket (faster repeat calls)
 
 Examples:
     gilligan play
@@ -37,49 +38,253 @@ Examples:
     gilligan validate --key C --scale major 'c d e f | g a b c |'
     gilligan stage --track Piano --abc 'c d e f | g a b c |'
     gilligan workflow --track Bass --abc 'C, C, E, G, |'
+
+Daemon mode:
+    While `gilligan daemon` is running, every other gilligan invocation is
+    forwarded to it over /tmp/skipper/gilligan.sock, skipping interpreter
+    and import start-up and reusing its HTTP connections.
 """
 
-import argparse
+import atexit
+import http.client
+import io
 import json
-import subprocess
+import os
+import re
+import socket
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+import urllib.parse
 from pathlib import Path
 
+# Heavier modules (argparse, concurrent.futures, subprocess, orjson, the
+# validator) are imported on first use so transport commands start fast.
+
 GILLIGAN_URL = "http://localhost:61170/api"
 VALIDATOR_PATH = Path(__file__).parent / "validate_program.py"
+VALIDATOR_CACHE_DIR = Path("/tmp/skipper/.vcache")
+
+# Parsed once so api_call doesn't re-split the URL on every request
+_API_URL = urllib.parse.urlsplit(GILLIGAN_URL)
+_API_HOST, _API_PORT, _API_PATH = _API_URL.hostname, _API_URL.port, _API_URL.path
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Commands whose request bodies are encoded with orjson when available
+_BULK_COMMANDS = {"stage"}
+
+# First ABC title header line (T:...)
+_ABC_TITLE_RE = re.compile(r'^T:(.*)$', re.MULTILINE)
+
+# Read-only queries the daemon may answer from cache for RESPONSE_CACHE_TTL
+# seconds; only enabled by `gilligan daemon`, where the process outlives a call
+RESPONSE_CACHE_TTL = 0.25
+_CACHEABLE = {"transport", "tracks", "track", "device", "snapshot"}
+_response_cache: dict[tuple[str, bool], tuple[float, dict | bytes]] = {}
+_response_cache_enabled = False
+
+# Idle keep-alive connections, shared by the main thread and _executor workers
+_idle_connections: list[http.client.HTTPConnection] = []
+_connections_lock = threading.Lock()
+_executor: "concurrent.futures.ThreadPoolExecutor | None" = None
+_orjson = None
+_validator = None
+
+
+def _get_orjson():
+    """Import orjson on first use; False if it isn't installed."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:  # Optional speedup; stdlib json works the same
+            _orjson = False
+    return _orjson
+
+
+def _get_validator():
+    """Import validate_program on first use; False if it can't be imported."""
+    global _validator
+    if _validator is None:
+        sys.path.insert(0, str(VALIDATOR_PATH.parent))
+        try:
+            import validate_program
+            _validator = validate_program
+        except Exception:  # Missing, or broken mid-edit: the subprocess reports why
+            _validator = False
+    return _validator
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes for the wire."""
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize to 2-space indented JSON bytes for staging files."""
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON from bytes (or str)."""
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _acquire_connection() -> http.client.HTTPConnection:
+    """Take an idle keep-alive connection to Gilligan, or open a new one."""
+    with _connections_lock:
+        if _idle_connections:
+            return _idle_connections.pop()
+    return http.client.HTTPConnection(_API_HOST, _API_PORT, timeout=5)
+
+
+def _release_connection(conn: http.client.HTTPConnection):
+    """Return a healthy connection to the idle pool."""
+    with _connections_lock:
+        _idle_connections.append(conn)
+
+
+@atexit.register
+def _close_connections():
+    with _connections_lock:
+        for conn in _idle_connections:
+            conn.close()
+        _idle_connections.clear()
+
 
+def _get_executor() -> "concurrent.futures.ThreadPoolExecutor":
+    """Get the shared worker pool for overlapping independent I/O."""
+    global _executor
+    if _executor is None:
+        import concurrent.futures
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    return _executor
 
-def api_call(command: str, args: dict | None = None) -> dict:
-    """Call Gilligan REST API."""
-    url = f"{GILLIGAN_URL}/{command}"
+
+def _request(method: str, path: str, body: bytes | None,
+             headers: dict) -> tuple[int, str, bytes]:
+    """Send one request, reconnecting once if Gilligan dropped an idle connection."""
+    conn = _acquire_connection()
+    try:
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            # Covers http.client.RemoteDisconnected on a stale keep-alive socket
+            conn.close()
+            if not reused:
+                raise
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+        data = resp.read()
+    except BaseException:
+        conn.close()
+        raise
+    _release_connection(conn)
+    return resp.status, resp.reason, data
+
+
+def api_call(command: str, args: dict | None = None,
+             raw: bool = False) -> dict | bytes:
+    """
+    Call Gilligan REST API.
+
+    With raw=True a successful response body is returned as unparsed bytes;
+    errors are still returned as dicts. In daemon mode, read-only queries
+    are served from a short-lived cache that any other command clears.
+    """
+    cacheable = _response_cache_enabled and args is None and command in _CACHEABLE
+    if cacheable:
+        hit = _response_cache.get((command, raw))
+        if hit and time.monotonic() - hit[0] < RESPONSE_CACHE_TTL:
+            return hit[1]
+    elif _response_cache:
+        # play/stop/stage/... may change anything a query would report
+        _response_cache.clear()
+
+    result = _api_call_uncached(command, args, raw)
+    if cacheable and not (isinstance(result, dict) and "error" in result):
+        _response_cache[(command, raw)] = (time.monotonic(), result)
+    return result
+
+
+def _api_call_uncached(command: str, args: dict | None, raw: bool) -> dict | bytes:
+    """Send one API request and decode the response (see api_call)."""
+    path = f"{_API_PATH}/{command}"
 
     try:
         if args:
-            data = json.dumps(args).encode('utf-8')
-            req = urllib.request.Request(url, data=data,
-                                          headers={'Content-Type': 'application/json'})
+            # Only stage payloads are big enough to pay for importing orjson
+            data = _dumps(args) if command in _BULK_COMMANDS else json.dumps(args).encode('utf-8')
+            status, reason, body = _request("POST", path, data, _JSON_HEADERS)
         else:
-            req = urllib.request.Request(url)
-
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            return json.loads(resp.read().decode('utf-8'))
+            status, reason, body = _request("GET", path, None, {})
 
-    except urllib.error.URLError as e:
-        return {"error": f"Connection failed: {e.reason}. Is Bitwig running with Gilligan?"}
-    except urllib.error.HTTPError as e:
-        try:
-            body = json.loads(e.read().decode('utf-8'))
-            return body
-        except:
-            return {"error": f"HTTP {e.code}: {e.reason}"}
+    except OSError as e:
+        return {"error": f"Connection failed: {e}. Is Bitwig running with Gilligan?"}
     except Exception as e:
         return {"error": str(e)}
 
+    if raw and status < 400:
+        return body
+
+    try:
+        # Replies are small; stdlib json avoids the orjson import on cold calls
+        return json.loads(body)
+    except ValueError:
+        if status >= 400:
+            return {"error": f"HTTP {status}: {reason}"}
+        return {"error": f"Invalid JSON response from Gilligan (HTTP {status})"}
+
+
+def _validator_cache_path(abc: str, key: str | None, scale: str | None) -> Path | None:
+    """Cache file for a validator run, keyed by its inputs and the validator version."""
+    import hashlib
+    try:
+        version = VALIDATOR_PATH.stat().st_mtime_ns
+    except OSError:  # No validator to version by; the run reports the error
+        return None
+    digest = hashlib.blake2b(f"{version}|{abc}|{key}|{scale}".encode('utf-8'),
+                             digest_size=16).hexdigest()
+    return VALIDATOR_CACHE_DIR / f"{digest}.json"
+
 
 def validate_abc(abc: str, key: str | None = None, scale: str | None = None) -> dict:
     """Validate ABC notation using the validator tool."""
+    # Run the validator in-process when possible; the subprocess is the fallback
+    validator = _get_validator()
+    if hasattr(validator, "validate"):
+        try:
+            return validator.validate(abc, key=key, scale=scale)
+        except Exception as e:
+            return {"valid": False, "errors": [f"Validator error: {e}"]}
+
+    return _validate_abc_subprocess(abc, key, scale)
+
+
+def _validate_abc_subprocess(abc: str, key: str | None, scale: str | None) -> dict:
+    """Validate by running the validator script (results cached on disk)."""
+    import subprocess
+    import tempfile
+
+    cache_path = _validator_cache_path(abc, key, scale)
+    if cache_path is not None:
+        try:
+            return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
+
     cmd = [sys.executable, str(VALIDATOR_PATH)]
 
     if key:
@@ -91,12 +296,27 @@ def validate_abc(abc: str, key: str | None = None, scale: str | None = None) ->
 
     try:
         result = subprocess.run(cmd, capture_output=True, text=True)
-        return json.loads(result.stdout)
+        validation = json.loads(result.stdout)
     except json.JSONDecodeError:
         return {"valid": False, "errors": [f"Validator error: {result.stderr}"]}
     except Exception as e:
         return {"valid": False, "errors": [str(e)]}
 
+    if cache_path is None:
+        return validation
+
+    # Write atomically so concurrent runs never see a partial entry
+    try:
+        VALIDATOR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=VALIDATOR_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(result.stdout)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+    return validation
+
 
 def cmd_play(args):
     """Start playback."""
@@ -155,7 +375,15 @@ def cmd_device(args):
 
 def cmd_snapshot(args):
     """Get full project snapshot."""
-    result = api_call("snapshot")
+    result = api_call("snapshot", raw=True)
+    if isinstance(result, bytes):
+        if sys.stdout.isatty():
+            # Pretty-print for people; pipes get Gilligan's bytes untouched
+            print(json.dumps(_loads(result), indent=2))
+        else:
+            sys.stdout.buffer.write(result)
+            sys.stdout.buffer.write(b"\n")
+        return 0
     print(json.dumps(result, indent=2))
     return 0 if "error" not in result else 1
 
@@ -206,8 +434,7 @@ def cmd_stage(args):
             return 1
         program = validation.get("program")
     else:
-        with open(args.json_file) as f:
-            program = json.load(f)
+        program = _loads(Path(args.json_file).read_bytes())
 
     # Stage via API
     result = api_call("stage", {
@@ -221,6 +448,16 @@ def cmd_stage(args):
 SKIPPER_STAGING_DIR = Path("/tmp/skipper")
 
 
+def write_atomic(path: Path, data: bytes):
+    """Write a file via temp + fsync + rename so Skipper never sees a partial write."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 def cmd_workflow(args):
     """Full workflow: validate ABC → write to staging file for Skipper."""
     if not args.abc and not args.file:
@@ -239,28 +476,40 @@ def cmd_workflow(args):
 
     print(f"=== Workflow: {track} ===")
 
-    # Set tempo if specified
+    # Tempo, time signature and validation are independent - run them
+    # concurrently, starting validation first since it takes longest
+    # (including the validator's first-use import)
+    executor = _get_executor()
+    validation_future = executor.submit(validate_abc, abc, args.key, args.scale)
+
+    tempo_future = None
     if hasattr(args, 'tempo') and args.tempo:
-        print(f"\n0a. Setting tempo to {args.tempo} BPM...")
-        result = api_call("tempo", {"bpm": args.tempo})
-        if "error" not in result:
-            print("   OK")
+        tempo_future = executor.submit(api_call, "tempo", {"bpm": args.tempo})
 
-    # Set time signature if specified
+    timesig_future = None
     if hasattr(args, 'timesig') and args.timesig:
         parts = args.timesig.split("/")
         if len(parts) == 2:
-            print(f"\n0b. Setting time signature to {args.timesig}...")
-            result = api_call("timesig", {
+            timesig_future = executor.submit(api_call, "timesig", {
                 "numerator": int(parts[0]),
                 "denominator": int(parts[1])
             })
-            if "error" not in result:
-                print("   OK")
+
+    # Set tempo if specified
+    if tempo_future:
+        print(f"\n0a. Setting tempo to {args.tempo} BPM...")
+        if "error" not in tempo_future.result():
+            print("   OK")
+
+    # Set time signature if specified
+    if timesig_future:
+        print(f"\n0b. Setting time signature to {args.timesig}...")
+        if "error" not in timesig_future.result():
+            print("   OK")
 
     # Step 1: Validate
     print("\n1. Validating ABC...")
-    validation = validate_abc(abc, args.key, args.scale)
+    validation = validation_future.result()
 
     if not validation.get("valid"):
         print("   FAILED:")
@@ -282,29 +531,22 @@ def cmd_workflow(args):
     staging_file = SKIPPER_STAGING_DIR / f"{track}.json"
 
     # Add metadata - extract title from ABC if not provided
-    abc_title = None
-    for line in abc.split('\n'):
-        if line.startswith('T:'):
-            abc_title = line[2:].strip()
-            break
+    title_match = _ABC_TITLE_RE.search(abc)
+    abc_title = title_match.group(1).strip() if title_match else None
     program["name"] = args.name or abc_title or f"{track} Program"
     program["version"] = 1
 
-    with open(staging_file, 'w') as f:
-        json.dump(program, f, indent=2)
-
-    # Verify JSON is valid by reading it back
+    data = _dumps_indented(program)
     try:
-        with open(staging_file) as f:
-            verified = json.load(f)
-        if verified.get("name") != program["name"]:
-            print(f"   ERROR: JSON verification failed - name mismatch")
-            return 1
-        print(f"   Written: {staging_file}")
-        print(f"   Verified: {verified['name']} ({len(verified.get('notes', []))} notes, {verified.get('lengthBars')} bars)")
-    except json.JSONDecodeError as e:
-        print(f"   ERROR: Invalid JSON written: {e}")
+        write_atomic(staging_file, data)
+    except OSError as e:
+        print(f"   ERROR: Could not write staging file: {e}")
+        return 1
+    if staging_file.stat().st_size != len(data):
+        print("   ERROR: Staging file size mismatch")
         return 1
+    print(f"   Written: {staging_file}")
+    print(f"   Verified: {program['name']} ({len(program.get('notes', []))} notes, {program.get('lengthBars')} bars)")
 
     # Step 3: Also notify Gilligan (if running)
     print("\n3. Notifying Gilligan...")
@@ -327,8 +569,8 @@ def cmd_workflow(args):
     return 0
 
 
-SKIPPER_STAGING_DIR = Path("/tmp/skipper")
-TRACKS = ["Piano", "Bass", "Guitar", "Kick", "Snare", "Violin"]
+TRACKS = ("Piano", "Bass", "Guitar", "Kick", "Snare", "Violin")
+SONGS_INDEX_PATH = SKIPPER_STAGING_DIR / ".songs-index.json"
 
 
 def ensure_playing():
@@ -343,16 +585,46 @@ def ensure_playing():
 
 def touch_file(path: Path):
     """Touch file to trigger reload."""
-    import time
-    path.touch()
-    # Small delay to ensure file system picks up the change
-    time.sleep(0.05)
+    os.utime(path, None)
 
 
-def cmd_song(args):
-    """Load a complete song on all tracks with retry and playback."""
-    import time
+def stage_file(dst: Path, data: bytes):
+    """
+    Write a song track's bytes to its staging file, atomically.
+
+    Does nothing if dst already holds the same content. Otherwise the
+    staging file gets a fresh inode of its own: dj.sh copies and touches
+    staging files in place, and Skipper polls their mtimes, so one must
+    never share an inode with songs/.
+    """
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        dst_stat = None
+    if (dst_stat is not None and dst_stat.st_size == len(data)
+            and dst.read_bytes() == data):
+        return  # Same bytes from an earlier copy
+
+    write_atomic(dst, data)
+
 
+def _load_track(song_path: Path, track: str) -> dict | None:
+    """Stage a song's track program and return it (None if absent)."""
+    src = song_path / f"{track}.json"
+    dst = SKIPPER_STAGING_DIR / f"{track}.json"
+
+    try:
+        data = src.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    # Stage and parse from the same read
+    stage_file(dst, data)
+    return _loads(data)
+
+
+def cmd_song(args):
+    """Load a complete song on all tracks and start playback."""
     songs_dir = Path(__file__).parent.parent / "songs"
     song_path = songs_dir / args.song
 
@@ -375,50 +647,37 @@ def cmd_song(args):
     SKIPPER_STAGING_DIR.mkdir(parents=True, exist_ok=True)
 
     # Load all tracks
-    loaded = 0
+    stages = []
+    loaded_paths: list[Path] = []
     max_bars = 0
-    for track in TRACKS:
-        src = song_path / f"{track}.json"
-        dst = SKIPPER_STAGING_DIR / f"{track}.json"
-
-        if src.exists():
-            # Copy to staging
-            import shutil
-            shutil.copy(src, dst)
-
-            # Read to get bar count
-            with open(dst) as f:
-                program = json.load(f)
+    programs = _get_executor().map(lambda t: _load_track(song_path, t), TRACKS)
+    for track, program in zip(TRACKS, programs):
+        if program is not None:
             bars = program.get("lengthBars", 8)
             if bars > max_bars:
                 max_bars = bars
 
             print(f"   {track}: {program.get('name', 'Unknown')} ({bars} bars)")
-            loaded += 1
+            stages.append({"track": track, "program": program})
+            loaded_paths.append(SKIPPER_STAGING_DIR / f"{track}.json")
 
-    if loaded == 0:
+    if not stages:
         print("   ERROR: No tracks found in song")
         return 1
 
-    print(f"\n   Loaded {loaded}/{len(TRACKS)} tracks, max {max_bars} bars")
-
-    # Retry logic - touch files to ensure reload
-    print("\n   Verifying load...")
-    time.sleep(0.2)  # Wait for initial load
-
-    retries = 3
-    for attempt in range(retries):
-        # Touch all files to trigger reload
-        for track in TRACKS:
-            dst = SKIPPER_STAGING_DIR / f"{track}.json"
-            if dst.exists():
-                touch_file(dst)
-
-        time.sleep(0.15)  # Wait for reload
-
-        if attempt < retries - 1:
-            print(f"   Retry {attempt + 1}...")
+    print(f"\n   Loaded {len(stages)}/{len(TRACKS)} tracks, max {max_bars} bars")
 
+    # Stage all tracks in one call - Gilligan sends each Skipper a
+    # Program Change, which makes it reload from its staging file
+    print("\n   Staging tracks...")
+    result = api_call("stage", {"stages": stages, "commitAt": "next_bar"})
+    if "error" in result:
+        # No Gilligan: fall back to nudging Skipper's file watcher
+        print("   Warning: Gilligan not responding, touching staging files")
+        for path in loaded_paths:
+            touch_file(path)
+        # One settle delay for the whole sweep so the watcher picks it up
+        time.sleep(0.15)
     print("   OK")
 
     # Ensure playing
@@ -430,6 +689,27 @@ def cmd_song(args):
     return 0
 
 
+def _song_stamp(song_path: str) -> list[int]:
+    """Modification stamp covering a song's track list and tempo."""
+    try:
+        tempo_mtime = os.stat(os.path.join(song_path, "tempo.txt")).st_mtime_ns
+    except FileNotFoundError:
+        tempo_mtime = 0
+    return [os.stat(song_path).st_mtime_ns, tempo_mtime]
+
+
+def _scan_song(song_path: str) -> dict:
+    """Read a song's track count and tempo from disk."""
+    with os.scandir(song_path) as entries:
+        names = {e.name for e in entries}
+
+    track_count = sum(1 for t in TRACKS if f"{t}.json" in names)
+    tempo = "120"
+    if "tempo.txt" in names:
+        tempo = Path(song_path, "tempo.txt").read_text().strip()
+    return {"tracks": track_count, "tempo": tempo}
+
+
 def cmd_songs(args):
     """List available songs."""
     songs_dir = Path(__file__).parent.parent / "songs"
@@ -438,20 +718,218 @@ def cmd_songs(args):
         print('{"error": "Songs directory not found"}')
         return 1
 
-    songs = sorted([d.name for d in songs_dir.iterdir() if d.is_dir()])
+    with os.scandir(songs_dir) as entries:
+        song_paths = {e.name: e.path for e in entries if e.is_dir()}
+    songs = sorted(song_paths)
+
+    # Reuse cached metadata for songs whose directory and tempo are unchanged
+    try:
+        cached = _loads(SONGS_INDEX_PATH.read_bytes())
+    except (OSError, ValueError):
+        cached = {}
+
+    index = {}
+    for song in songs:
+        stamp = _song_stamp(song_paths[song])
+        entry = cached.get(song)
+        if not entry or entry.get("mtime") != stamp:
+            entry = {**_scan_song(song_paths[song]), "mtime": stamp}
+        index[song] = entry
+
+    if index != cached:
+        try:
+            SKIPPER_STAGING_DIR.mkdir(parents=True, exist_ok=True)
+            write_atomic(SONGS_INDEX_PATH, _dumps(index))
+        except OSError:
+            pass
 
     print(f"=== Available Songs ({len(songs)}) ===")
     for song in songs:
-        song_path = songs_dir / song
+        print(f"  {song:25} {index[song]['tracks']}/6 tracks, {index[song]['tempo']} BPM")
+
+    return 0
+
+
+DAEMON_SOCKET = SKIPPER_STAGING_DIR / "gilligan.sock"
+# Seconds a client waits for the daemon to take its request before running
+# the command itself, and then for the daemon's reply
+DAEMON_ACCEPT_TIMEOUT = 0.5
+DAEMON_REPLY_TIMEOUT = 60
+# Sent as soon as the daemon has read a request. A client that gave up has
+# closed its socket by then, so the send fails and the request is dropped.
+_DAEMON_ACK = b"+"
+
+
+class _CapturedStdout(io.TextIOWrapper):
+    """In-memory stdout for daemon requests that reports the client's TTY state."""
+
+    def __init__(self, tty: bool):
+        super().__init__(io.BytesIO(), encoding='utf-8', write_through=True)
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def getvalue(self) -> str:
+        return self.buffer.getvalue().decode('utf-8', errors='replace')
 
-        # Count tracks
-        track_count = sum(1 for t in TRACKS if (song_path / f"{t}.json").exists())
 
-        # Get tempo
-        tempo_file = song_path / "tempo.txt"
-        tempo = tempo_file.read_text().strip() if tempo_file.exists() else "120"
+def _recv_all(sock: socket.socket) -> bytes:
+    """Read from a socket until the peer shuts down its write side."""
+    chunks = []
+    while chunk := sock.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
 
-        print(f"  {song:25} {track_count}/6 tracks, {tempo} BPM")
+
+def _serve_daemon_request(conn: socket.socket):
+    """Run one forwarded command line and send back its output and exit code."""
+    import contextlib
+    import traceback
+
+    data = _recv_all(conn)
+    if not data:  # Liveness probe from another `gilligan daemon`
+        return
+    conn.sendall(_DAEMON_ACK)
+    request = _loads(data)
+
+    stdout = _CapturedStdout(request.get("tty", False))
+    stderr = io.StringIO()
+    cwd = os.getcwd()
+    try:
+        os.chdir(request.get("cwd", cwd))
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = run(request["argv"])
+            except SystemExit as e:  # argparse errors and --help
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        os.chdir(cwd)
+
+    conn.sendall(_dumps({
+        "exit": code or 0,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }))
+
+
+def _forward_to_daemon(argv: list[str]) -> int | None:
+    """Run argv in a running gilligan daemon; None if no daemon is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        # A stopped or wedged daemon still accepts connections: run the
+        # command here unless it takes the request promptly
+        sock.settimeout(DAEMON_ACCEPT_TIMEOUT)
+        try:
+            sock.connect(str(DAEMON_SOCKET))
+            sock.sendall(json.dumps({"argv": argv, "cwd": os.getcwd(),
+                                     "tty": sys.stdout.isatty()}).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            if sock.recv(1) != _DAEMON_ACK:
+                return None
+        except OSError:  # Includes socket.timeout
+            return None
+
+        sock.settimeout(DAEMON_REPLY_TIMEOUT)
+        try:
+            reply = _recv_all(sock)
+        except socket.timeout:
+            print('{"error": "Gilligan daemon did not reply"}')
+            return 1
+
+    try:
+        # Stdlib json: the client is the cold path the daemon exists to speed up
+        reply = json.loads(reply)
+    except ValueError:
+        print('{"error": "Gilligan daemon closed the connection"}')
+        return 1
+
+    if reply.get("restart"):  # Daemon is reloading edited code
+        return None
+
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    return reply["exit"]
+
+
+def _source_mtimes() -> tuple:
+    """Mtimes of the code a daemon has imported, to notice edits while it runs."""
+    mtimes = []
+    for path in (Path(__file__), VALIDATOR_PATH):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def cmd_daemon(args):
+    """Serve gilligan commands over a Unix socket until interrupted."""
+    global _response_cache_enabled
+    sources = _source_mtimes()
+    SKIPPER_STAGING_DIR.mkdir(parents=True, exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.connect(str(DAEMON_SOCKET))
+        server.close()
+        print(f'{{"error": "Daemon already running on {DAEMON_SOCKET}"}}')
+        return 1
+    except OSError:
+        pass
+    DAEMON_SOCKET.unlink(missing_ok=True)  # Stale socket from a crashed daemon
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(DAEMON_SOCKET))
+    server.listen()
+    _response_cache_enabled = True
+    print(f"Gilligan daemon listening on {DAEMON_SOCKET} (Ctrl-C to stop)")
+    sys.stdout.flush()
+
+    # Clean up the socket on `kill` as well as Ctrl-C, but let a request
+    # that is already running finish and reply first
+    import signal
+    busy = stopping = restart = False
+
+    def on_sigterm(signum, frame):
+        nonlocal stopping
+        stopping = True
+        if not busy:
+            raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+
+    try:
+        while not stopping:
+            conn, _ = server.accept()
+            busy = True
+            # gilligan.py or the validator was edited: have the client run
+            # this command itself while a fresh daemon loads the new code
+            restart = _source_mtimes() != sources
+            with conn:
+                try:
+                    if restart:
+                        _recv_all(conn)  # Let the client finish sending first
+                        conn.sendall(_DAEMON_ACK + _dumps({"restart": True}))
+                    else:
+                        _serve_daemon_request(conn)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"   Warning: dropped request: {e}", file=sys.stderr)
+            if restart:
+                break
+            busy = False
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        DAEMON_SOCKET.unlink(missing_ok=True)
+
+    if restart and not stopping:
+        print("Gilligan source changed, restarting daemon")
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, str(Path(__file__).resolve()), "daemon"])
 
     return 0
 
@@ -462,7 +940,49 @@ def cmd_help(args):
     return 0
 
 
-def main():
+_DISPATCH = {
+    "play": cmd_play,
+    "stop": cmd_stop,
+    "record": cmd_record,
+    "transport": cmd_transport,
+    "tracks": cmd_tracks,
+    "track": cmd_track,
+    "device": cmd_device,
+    "snapshot": cmd_snapshot,
+    "create_track": cmd_create_track,
+    "rename_track": cmd_rename_track,
+    "validate": cmd_validate,
+    "stage": cmd_stage,
+    "workflow": cmd_workflow,
+    "song": cmd_song,
+    "songs": cmd_songs,
+    "daemon": cmd_daemon,
+}
+
+# Commands without flags skip building the argparse tree entirely
+_NO_ARG = {"play", "stop", "record", "transport", "tracks", "track", "device",
+           "snapshot", "songs", "daemon"}
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Hand off to a running daemon unless this invocation starts one
+    if argv[:1] != ["daemon"]:
+        code = _forward_to_daemon(argv)
+        if code is not None:
+            return code
+
+    return run(argv)
+
+
+def run(argv: list[str]):
+    """Parse and execute one gilligan command line in this process."""
+    if len(argv) == 1 and argv[0] in _NO_ARG:
+        return _DISPATCH[argv[0]](None)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Gilligan CLI - Control Bitwig via REST",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -527,35 +1047,20 @@ def main():
     # Songs - list available songs
     subparsers.add_parser("songs", help="List available songs")
 
+    # Daemon - keep a warm process serving commands
+    subparsers.add_parser("daemon", help="Serve commands over a Unix socket")
+
     # Help
     subparsers.add_parser("help", help="Show help")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command or args.command == "help":
         parser.print_help()
         return 0
 
     # Dispatch
-    commands = {
-        "play": cmd_play,
-        "stop": cmd_stop,
-        "record": cmd_record,
-        "transport": cmd_transport,
-        "tracks": cmd_tracks,
-        "track": cmd_track,
-        "device": cmd_device,
-        "snapshot": cmd_snapshot,
-        "create_track": cmd_create_track,
-        "rename_track": cmd_rename_track,
-        "validate": cmd_validate,
-        "stage": cmd_stage,
-        "workflow": cmd_workflow,
-        "song": cmd_song,
-        "songs": cmd_songs,
-    }
-
-    handler = commands.get(args.command)
+    handler = _DISPATCH.get(args.command)
     if handler:
         return handler(args)
     else:
@@ -0,0 +1,147 @@
+"""Tests for validate_program.py. Run with: python -m pytest tools"""
+
+import pytest
+
+import validate_program as vp
+
+
+@pytest.mark.parametrize("abc, tokens", [
+    ("C D E F | G A B c |", ['C', 'D', 'E', 'F', 'G', 'A', 'B', 'c']),
+    ("X:1\nT:Tune\nK:C\nc2 d/2 e3/2 | z2 [CEG] |", ['c2', 'd/2', 'e3/2', 'z2', '[CEG]']),
+    ("^c _B, =f c'' C,,", ['^c', '_B,', '=f', "c''", 'C,,']),
+    ("[C E G]2 | [c e g]/2", ['[C E G]2', '[c e g]/2']),
+    ("c-c d|e", ['c', 'c', 'd', 'e']),
+    ("", []),
+])
+def test_tokenize_abc(abc, tokens):
+    assert vp.tokenize_abc(abc) == tokens
+
+
+@pytest.mark.parametrize("token, expected", [
+    ('c', (60, 1.0)),
+    ('C', (48, 1.0)),
+    ('^c', (61, 1.0)),
+    ('^^c', (62, 1.0)),
+    ('__e', (62, 1.0)),
+    ('_B,', (46, 1.0)),
+    ('=f', (65, 1.0)),
+    ("c''", (84, 1.0)),
+    ('C,,', (24, 1.0)),
+    ('c2', (60, 2.0)),
+    ('d/2', (62, 0.5)),
+    ('e3/2', (64, 1.5)),
+    ('z', (-1, 1.0)),
+    ('z2', (-1, 2.0)),
+    ('z/4', (-1, 0.25)),
+])
+def test_parse_abc_note(token, expected):
+    assert vp.parse_abc_note(token) == expected
+
+
+def test_parse_abc_note_rejects_unknown_letters():
+    with pytest.raises(ValueError):
+        vp.parse_abc_note('q')
+
+
+@pytest.mark.parametrize("chord, expected", [
+    ('[CEG]', ((48, 52, 55), 1.0)),
+    ('[CEG]2', ((48, 52, 55), 2.0)),
+    ('[c e g]/2', ((60, 64, 67), 0.5)),
+])
+def test_chord_tokens(chord, expected):
+    assert vp._parse_token(chord) == expected
+    notes, duration = vp.parse_abc_chord(chord)
+    assert notes == [(pitch, expected[1]) for pitch in expected[0]]
+    assert duration == expected[1]
+
+
+@pytest.mark.parametrize("abc, length_bars", [
+    ('', 0.125),
+    ('z/4', 0.125),
+    ('z', 0.25),
+    ('z4', 1.0),
+    ('z5', 2.0),
+    ('z8', 2.0),
+    ('z9', 4.0),
+    ('z64', 16.0),
+    ('z100', 16.0),
+])
+def test_length_rounds_up_to_a_valid_bar_length(abc, length_bars):
+    program, errors = vp.abc_to_program(abc)
+    assert not errors
+    assert program['lengthBars'] == length_bars
+
+
+@pytest.mark.parametrize("length_bars, valid", [
+    (0.125, True), (1, True), (16, True), (4.0005, True),
+    (0.1, False), (3, False), (32, False),
+])
+def test_is_valid_bar_length(length_bars, valid):
+    assert vp._is_valid_bar_length(length_bars) is valid
+
+
+@pytest.mark.parametrize("pitch, beats, abc", [
+    (60, 1, 'c'),
+    (61, 1, '^c'),
+    (48, 2, 'C2'),
+    (72, 0.5, "c'/2"),
+    (24, 0.25, 'C,,/4'),
+    (0, 1, 'C,,,,'),
+    (127, 3, "g'''''3"),
+    (70, 1.5, '^a6/4'),
+])
+def test_midi_to_abc(pitch, beats, abc):
+    assert vp.midi_to_abc(pitch, beats) == abc
+
+
+@pytest.mark.parametrize("abc, expected", [
+    # A short note at beat 1.0 and at 3.0 is followed, not joined, by the next
+    ("b a/3240 D8", "b a D8 |"),
+    ("b b b a/3240 A", "b b b a A |"),
+    ("b b a/3240 A", "b b a A |"),
+    ("z a/3000 A", "a A |"),
+    ("c c c a/3240 A", "c c c a A |"),
+    # Real chords still group
+    ("[ceg] c", "[ceg] c |"),
+    ("c [CEG]2 d", "c [CEG]2 d |"),
+])
+def test_short_notes_are_not_merged_into_chords(abc, expected):
+    result = vp.validate_abc(abc)
+    assert result.valid
+    assert result.abc_output == expected
+    program, errors = vp.abc_to_program(abc)
+    assert not errors
+    assert vp.program_to_abc(program) == expected
+
+
+def test_start_noise_does_not_split_a_chord():
+    notes = [
+        {'pitch': 60, 'startBeat': 3.0, 'lengthBeats': 1.0, 'velocity': 0.8},
+        {'pitch': 64, 'startBeat': 3.0 + 1e-9, 'lengthBeats': 1.0, 'velocity': 0.8},
+        {'pitch': 67, 'startBeat': 3.0 - 1e-9, 'lengthBeats': 1.0, 'velocity': 0.8},
+    ]
+    groups = vp._group_by_start(notes)
+    assert len(groups) == 1
+    assert sorted(n['pitch'] for n in groups[0][1]) == [60, 64, 67]
+
+
+@pytest.mark.parametrize("name, pitch_class", [
+    ('B', 11), ('b', 11), ('Bb', 10), ('bb', 10), ('BB', 10),
+    ('C', 0), ('F#', 6), ('Db', 1), ('Cb', 11),
+    ('H', None), ('', None), (None, None),
+])
+def test_parse_key(name, pitch_class):
+    assert vp.parse_key(name) == pitch_class
+
+
+def test_validate_warns_outside_scale():
+    result = vp.validate("c ^c", key='C', scale='major')
+    assert result['valid']
+    assert result['warnings'] == ['Note 1 (C#4): Outside C major scale']
+
+
+def test_validate_reports_parse_errors():
+    result = vp.validate("c c''''''''''")
+    assert not result['valid']
+    assert result['program'] is None
+    assert result['errors'] == ["Note out of MIDI range (0-127): c'''''''''' -> 180"]
@@ -11,6 +11,12 @@ Usage:
     python validate_program.py --file melody.abc
     python validate_program.py --json '{"lengthBars": 1, "notes": [...]}'
 
+Bulk offline validation: import the module and call validate() per input
+in one process. Starting the script once per file costs far more than
+validating a typical program.
+    import validate_program
+    results = [validate_program.validate(p.read_text()) for p in paths]
+
 ABC Notation Reference:
 - Notes: C D E F G A B c d e f g a b (lowercase = octave 5, uppercase = octave 4)
 - Middle C (C4, MIDI 60) = c (lowercase c)
@@ -34,13 +40,18 @@ Chord progression example:
 """
 
 import json
+import math
 import re
 import sys
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterator
 
 # Valid bar lengths: powers of 2 from 1/8 to 16 bars
-VALID_BAR_LENGTHS = [0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0]
+VALID_BAR_LENGTHS = frozenset([0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0])
+MIN_BAR_LENGTH = 0.125
+MAX_BAR_LENGTH = 16.0
+BAR_LENGTH_EPSILON = 0.001
 
 # ABC note mapping (C4 = middle C = MIDI 60 = lowercase c in ABC)
 # Note: ABC standard has middle C as C (uppercase), but we follow the common
@@ -50,6 +61,16 @@ ABC_BASE_NOTES = {
     'c': 60, 'd': 62, 'e': 64, 'f': 65, 'g': 67, 'a': 69, 'b': 71,
 }
 
+# Semitone offset for each ABC accidental prefix
+_ACC_MAP = {'': 0, '^': 1, '^^': 2, '_': -1, '__': -2, '=': 0}
+
+# Key names for --key, including enharmonic spellings
+_KEY_MAP = {
+    'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3, 'E': 4, 'F': 5,
+    'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8, 'Ab': 8, 'A': 9, 'A#': 10, 'Bb': 10,
+    'B': 11, 'Cb': 11, 'Fb': 4, 'E#': 5, 'B#': 0,
+}
+
 NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
 SCALES = {
@@ -63,8 +84,17 @@ SCALES = {
     'chromatic': list(range(12)),
 }
 
+# Patterns used on every parse, compiled once
+_SEP_RE = re.compile(r'[|\s]+')
+_DUR_RE = re.compile(r'(\d+(?:/\d+)?|\d*/\d+)$')
+_CHORD_NOTE_RE = re.compile(r"(\^{1,2}|_{1,2}|=)?([A-Ga-g])([',]*)")
+
+# Tokenizer character classes (see _char_class)
+(_C_OTHER, _C_SPACE, _C_NEWLINE, _C_LETTER, _C_ACCIDENTAL,
+ _C_OCTAVE, _C_DURATION, _C_CHORD) = range(8)
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     valid: bool
     abc_input: str
@@ -91,8 +121,8 @@ def midi_to_note_name(midi: int) -> str:
     return f"{note}{octave}"
 
 
-def midi_to_abc(pitch: int, duration_beats: float = 1.0) -> str:
-    """Convert MIDI pitch and duration to ABC notation."""
+def _abc_pitch(pitch: int) -> str:
+    """ABC note letter with accidental and octave marks for a MIDI pitch."""
     octave = pitch // 12
     note_in_octave = pitch % 12
 
@@ -119,77 +149,103 @@ def midi_to_abc(pitch: int, duration_beats: float = 1.0) -> str:
         if octave < 4:
             result += "," * (4 - octave)
 
-    # Duration
-    if abs(duration_beats - 0.25) < 0.01:
-        result += '/4'
-    elif abs(duration_beats - 0.5) < 0.01:
-        result += '/2'
-    elif abs(duration_beats - 1.0) < 0.01:
-        pass  # Default, no suffix
-    elif abs(duration_beats - 2.0) < 0.01:
-        result += '2'
-    elif abs(duration_beats - 3.0) < 0.01:
-        result += '3'
-    elif abs(duration_beats - 4.0) < 0.01:
-        result += '4'
-    elif duration_beats == int(duration_beats):
-        result += str(int(duration_beats))
+    return result
+
+
+_MIDI_TO_ABC_PREFIX = tuple(_abc_pitch(p) for p in range(128))
+
+# Suffixes for the common durations, keyed by length in quarter beats
+_DURATION_SUFFIXES = {1: '/4', 2: '/2', 4: '', 8: '2', 12: '3', 16: '4'}
+
+
+def _abc_duration(duration_beats: float) -> str:
+    """ABC duration suffix for a length not in _DURATION_SUFFIXES."""
+    if duration_beats == int(duration_beats):
+        return str(int(duration_beats))
+    # Express as fraction of quarter note
+    numerator = int(duration_beats * 4)
+    if numerator > 0:
+        return f'{numerator}/4'
+    return ''
+
+
+def midi_to_abc(pitch: int, duration_beats: float = 1.0) -> str:
+    """Convert MIDI pitch and duration to ABC notation."""
+    if type(pitch) is int and 0 <= pitch <= 127:
+        result = _MIDI_TO_ABC_PREFIX[pitch]
     else:
-        # Express as fraction of quarter note
-        numerator = int(duration_beats * 4)
-        if numerator > 0:
-            result += f'{numerator}/4'
+        result = _abc_pitch(pitch)
 
-    return result
+    # Common durations straight from the table
+    quarters = round(duration_beats * 4)
+    suffix = _DURATION_SUFFIXES.get(quarters)
+    if suffix is not None and abs(duration_beats - quarters / 4) < 0.01:
+        return result + suffix
+    return result + _abc_duration(duration_beats)
+
+
+def _parse_duration(dur_str: str) -> float:
+    """
+    Parse an ABC duration suffix to beats: '' -> 1, '2' -> 2, '3/2' -> 1.5,
+    '/2' -> 0.5.
+
+    Raises ValueError (or ZeroDivisionError for '/0') if it isn't a number.
+    """
+    if not dur_str:
+        return 1.0
+    if '/' in dur_str:
+        parts = dur_str.split('/')
+        if parts[0]:
+            return float(parts[0]) / float(parts[1])
+        return 1.0 / float(parts[1])
+    return float(dur_str)
 
 
+@lru_cache(maxsize=4096)
 def parse_abc_note(token: str) -> tuple[int, float]:
     """
     Parse a single ABC note token to (MIDI pitch, duration in beats).
 
     Returns (-1, duration) for rests.
     Raises ValueError for invalid tokens.
+
+    Results are memoized per token string: melodies repeat the same few
+    tokens over and over, so most calls are a dict lookup.
     """
     if not token:
         raise ValueError("Empty note token")
 
     note = token.strip()
+    c0 = note[:1]
 
     # Handle rest
-    if note.startswith('z') or note.startswith('Z'):
-        duration = 1.0
-        rest_part = note[1:]
-        if rest_part:
-            if '/' in rest_part:
-                parts = rest_part.split('/')
-                if parts[0]:
-                    duration = float(parts[0]) / float(parts[1])
-                else:
-                    duration = 1.0 / float(parts[1])
-            else:
-                try:
-                    duration = float(rest_part)
-                except ValueError:
-                    pass
+    if c0 == 'z' or c0 == 'Z':
+        try:
+            duration = _parse_duration(note[1:])
+        except ValueError:
+            if '/' in note:
+                raise
+            duration = 1.0  # Unreadable rest length counts as one beat
         return (-1, duration)
 
     accidental = 0
 
     # Check for accidental prefix
-    if note.startswith('^^'):
-        accidental = 2
-        note = note[2:]
-    elif note.startswith('^'):
-        accidental = 1
-        note = note[1:]
-    elif note.startswith('__'):
-        accidental = -2
-        note = note[2:]
-    elif note.startswith('_'):
-        accidental = -1
-        note = note[1:]
-    elif note.startswith('='):
-        accidental = 0
+    if c0 == '^':
+        if note[1:2] == '^':
+            accidental = 2
+            note = note[2:]
+        else:
+            accidental = 1
+            note = note[1:]
+    elif c0 == '_':
+        if note[1:2] == '_':
+            accidental = -2
+            note = note[2:]
+        else:
+            accidental = -1
+            note = note[1:]
+    elif c0 == '=':
         note = note[1:]
 
     if not note:
@@ -203,69 +259,139 @@ def parse_abc_note(token: str) -> tuple[int, float]:
     midi = ABC_BASE_NOTES[base_char] + accidental
     note = note[1:]
 
-    # Count octave modifiers
-    while note and note[0] == "'":
-        midi += 12
-        note = note[1:]
-    while note and note[0] == ",":
-        midi -= 12
-        note = note[1:]
+    # Count octave modifiers: a run of ' then a run of ,
+    if note and note[0] in "',":
+        rest = note.lstrip("'")
+        ups = len(note) - len(rest)
+        note = rest.lstrip(',')
+        midi += 12 * (ups - (len(rest) - len(note)))
 
     # Validate MIDI range
     if midi < 0 or midi > 127:
         raise ValueError(f"Note out of MIDI range (0-127): {token} -> {midi}")
 
     # Parse duration
-    duration = 1.0
-    if note:
+    try:
+        duration = _parse_duration(note)
+    except ValueError:
         if '/' in note:
-            parts = note.split('/')
-            if parts[0]:
-                duration = float(parts[0]) / float(parts[1])
-            else:
-                duration = 1.0 / float(parts[1])
-        else:
-            try:
-                duration = float(note)
-            except ValueError:
-                raise ValueError(f"Invalid duration in: {token}")
+            raise
+        raise ValueError(f"Invalid duration in: {token}")
 
     return (midi, duration)
 
 
-def parse_abc_chord(chord_str: str) -> list[tuple[int, float]]:
+def parse_abc_chord(chord_str: str) -> tuple[list[tuple[int, float]], float]:
     """
-    Parse ABC chord notation [CEG] to list of (MIDI, duration) tuples.
+    Parse ABC chord notation [CEG] to (list of (MIDI, duration) tuples, duration).
 
-    All notes in a chord share the same duration (from the last note or suffix).
+    All notes in a chord share the duration given by the suffix after the
+    closing bracket (e.g. [CEG]2), defaulting to one beat.
     """
-    # Remove brackets
-    inner = chord_str.strip('[]')
-    if not inner:
-        return []
-
     # Check for duration suffix after the chord content
     # e.g., [CEG]2 means all notes are half notes
     chord_duration = 1.0
-    duration_match = re.search(r'(\d+(?:/\d+)?|\d*/\d+)$', chord_str.rstrip(']'))
+    duration_match = _DUR_RE.search(chord_str.rstrip(']'))
+    if duration_match:
+        chord_duration = _parse_duration(duration_match.group(1))
+
+    # Remove brackets
+    inner = chord_str.strip('[]')
+    if not inner:
+        return [], chord_duration
 
     notes = []
     # Split into individual notes - be careful with accidentals
-    note_pattern = re.compile(r"(\^{1,2}|_{1,2}|=)?([A-Ga-g])([',]*)")
+    for accidental, letter, octave_mod in _CHORD_NOTE_RE.findall(inner):
+        # Same rules as parse_abc_note: a run of ' then a run of ,
+        rest = octave_mod.lstrip("'")
+        if rest.strip(','):
+            continue
+        midi = (ABC_BASE_NOTES[letter] + _ACC_MAP[accidental]
+                + 12 * (len(octave_mod) - 2 * len(rest)))
+        if 0 <= midi <= 127:
+            notes.append((midi, chord_duration))
 
-    for match in note_pattern.finditer(inner):
-        accidental_str = match.group(1) or ''
-        note_letter = match.group(2)
-        octave_mod = match.group(3) or ''
+    return notes, chord_duration
 
-        note_token = accidental_str + note_letter + octave_mod
-        try:
-            midi, _ = parse_abc_note(note_token)
-            notes.append((midi, chord_duration))
-        except ValueError:
-            continue
 
-    return notes
+@lru_cache(maxsize=4096)
+def _parse_token(token: str) -> tuple[tuple[int, ...], float]:
+    """
+    Parse a note, rest or chord token to (MIDI pitches, duration in beats).
+
+    Memoized like parse_abc_note, so repeated chords cost a lookup too.
+    """
+    if token[:1] == '[':
+        chord_notes, duration = parse_abc_chord(token)
+        return tuple(midi for midi, _ in chord_notes), duration
+    midi, duration = parse_abc_note(token)
+    return ((midi,) if midi >= 0 else ()), duration
+
+
+def _char_class(ch: str) -> int:
+    """Tokenizer character class for a single character."""
+    if ch == '\n':
+        return _C_NEWLINE
+    if ch.isspace():
+        return _C_SPACE
+    if ch.isdigit() or ch == '/':
+        return _C_DURATION
+    if ch in 'ABCDEFGabcdefgzZ':
+        return _C_LETTER
+    if ch in '^_=':
+        return _C_ACCIDENTAL
+    if ch in "',":
+        return _C_OCTAVE
+    if ch == '[':
+        return _C_CHORD
+    return _C_OTHER
+
+
+# Byte -> class table, applied to ASCII input in one bytes.translate() call
+_CHAR_CLASS = bytes(_char_class(chr(c)) for c in range(256))
+
+
+def _is_header(text: str, i: int) -> bool:
+    """True if a header field (X:, T:, K:, ...) starts at line position i."""
+    return 'A' <= text[i] <= 'Z' and text.startswith(':', i + 1)
+
+
+def _skip_line(text: str, i: int) -> int:
+    """Index of the newline ending the line at i (or len(text))."""
+    end = text.find('\n', i)
+    return len(text) if end == -1 else end
+
+
+def _scan_chord(text: str, classes: bytes, i: int) -> tuple[str, int] | None:
+    """
+    Read a chord starting at '[' (index i) that may span several lines.
+
+    Header lines inside the brackets are dropped, as they are at top level.
+    Returns (token, next index), or None if the chord is never closed.
+    """
+    n = len(text)
+    parts = []
+    seg = j = i + 1
+    while j < n:
+        ch = text[j]
+        if ch == ']':
+            break
+        j += 1
+        if ch == '\n' and j < n and _is_header(text, j):
+            parts.append(text[seg:j])
+            seg = j = _skip_line(text, j)
+    else:
+        return None
+
+    chord = '[' + ''.join(parts) + text[seg:j + 1]
+    chord = _SEP_RE.sub(' ', chord)
+
+    # Include duration suffix if present
+    k = j + 1
+    while k < n and classes[k] == _C_DURATION:
+        k += 1
+    return chord + text[j + 1:k], k
 
 
 def tokenize_abc(abc_str: str) -> list[str]:
@@ -277,73 +403,101 @@ def tokenize_abc(abc_str: str) -> list[str]:
     - Chords: [CEG], [CEG]2
     - Rests: z, z2, z/2
     - Ignores bar lines, headers, and whitespace
-    """
-    tokens = []
-
-    # Remove header lines (X:, K:, M:, etc.)
-    lines = abc_str.strip().split('\n')
-    note_lines = [l for l in lines if not re.match(r'^[A-Z]:', l)]
-    content = ' '.join(note_lines)
 
-    # Remove bar lines but preserve structure
-    content = re.sub(r'\|+', ' ', content)
-    content = re.sub(r'\s+', ' ', content).strip()
+    Single pass over the input: each character is classified through
+    _CHAR_CLASS and tokens are sliced straight out of abc_str.
+    """
+    text = abc_str
+    if text.isascii():
+        classes = text.encode('ascii').translate(_CHAR_CLASS)
+    else:
+        classes = bytes(_char_class(ch) for ch in text)
 
-    # Tokenize
+    tokens = []
+    n = len(text)
     i = 0
-    while i < len(content):
-        c = content[i]
+    # Typical input is one line with no headers
+    single_line = '\n' not in text
 
-        # Skip whitespace
-        if c.isspace():
-            i += 1
-            continue
+    # Leading whitespace doesn't count towards the first line
+    while i < n and classes[i] in (_C_SPACE, _C_NEWLINE):
+        i += 1
+    line_start = True
 
-        # Chord
-        if c == '[':
-            end = content.find(']', i)
-            if end == -1:
-                i += 1
-                continue
-            # Include duration suffix if present
-            chord = content[i:end + 1]
-            j = end + 1
-            while j < len(content) and (content[j].isdigit() or content[j] == '/'):
-                chord += content[j]
-                j += 1
-            tokens.append(chord)
-            i = j
+    while i < n:
+        # Remove header lines (X:, K:, M:, etc.)
+        if line_start and _is_header(text, i):
+            i = _skip_line(text, i)
             continue
 
-        # Note or rest
-        if c in 'ABCDEFGabcdefgzZ^_=':
-            token = ''
-            # Accidentals
-            while i < len(content) and content[i] in '^_=':
-                token += content[i]
+        cls = classes[i]
+        line_start = cls == _C_NEWLINE
+
+        # Note or rest: accidentals, letter, octave modifiers, duration
+        if cls == _C_LETTER or cls == _C_ACCIDENTAL:
+            start = i
+            while i < n and classes[i] == _C_ACCIDENTAL:
                 i += 1
-            # Note letter
-            if i < len(content) and content[i] in 'ABCDEFGabcdefgzZ':
-                token += content[i]
+            if i < n and classes[i] == _C_LETTER:
                 i += 1
-            # Octave modifiers
-            while i < len(content) and content[i] in "',":
-                token += content[i]
+            while i < n and classes[i] == _C_OCTAVE:
                 i += 1
-            # Duration
-            while i < len(content) and (content[i].isdigit() or content[i] == '/'):
-                token += content[i]
+            while i < n and classes[i] == _C_DURATION:
                 i += 1
-            if token:
-                tokens.append(token)
+            tokens.append(text[start:i])
             continue
 
-        # Skip unknown characters
+        # Chord
+        if cls == _C_CHORD:
+            j = text.find(']', i + 1)
+            if j != -1 and (single_line or text.find('\n', i, j) == -1):
+                # Common case: the whole chord sits on one line
+                chord = text[i:j + 1]
+                if _SEP_RE.search(chord):
+                    chord = _SEP_RE.sub(' ', chord)
+                i = j + 1
+                while i < n and classes[i] == _C_DURATION:
+                    i += 1
+                tokens.append(chord + text[j + 1:i])
+                continue
+            chord = _scan_chord(text, classes, i)
+            if chord is not None:
+                token, i = chord
+                tokens.append(token)
+                continue
+
+        # Skip whitespace, bar lines and unknown characters
         i += 1
 
     return tokens
 
 
+def _round_up_bar_length(bars: float) -> float:
+    """Smallest valid bar length that holds `bars` (within epsilon)."""
+    x = bars - BAR_LENGTH_EPSILON
+    if x <= MIN_BAR_LENGTH:
+        return MIN_BAR_LENGTH
+    if not x <= MAX_BAR_LENGTH:  # also catches NaN
+        return MAX_BAR_LENGTH
+    # x = m * 2**e with 0.5 <= m < 1, so 2**e is the next power of two
+    # unless x is one already
+    m, e = math.frexp(x)
+    return math.ldexp(1.0, e - 1 if m == 0.5 else e)
+
+
+def _is_valid_bar_length(length_bars: float) -> bool:
+    """True if length_bars is within epsilon of a valid bar length."""
+    if length_bars in VALID_BAR_LENGTHS:
+        return True
+    if not (MIN_BAR_LENGTH - BAR_LENGTH_EPSILON < length_bars
+            < MAX_BAR_LENGTH + BAR_LENGTH_EPSILON):
+        return False
+    # The only candidates are the powers of two either side of it
+    _, e = math.frexp(length_bars)
+    return (abs(length_bars - math.ldexp(1.0, e - 1)) < BAR_LENGTH_EPSILON
+            or abs(length_bars - math.ldexp(1.0, e)) < BAR_LENGTH_EPSILON)
+
+
 def abc_to_program(abc_str: str, beats_per_bar: int = 4,
                    default_velocity: float = 0.8) -> tuple[dict, list[str]]:
     """
@@ -360,60 +514,27 @@ def abc_to_program(abc_str: str, beats_per_bar: int = 4,
 
     for token in tokens:
         try:
-            if token.startswith('['):
-                # Chord - all notes start at same beat
-                chord_notes = parse_abc_chord(token)
-
-                # Get duration from last character if present
-                duration = 1.0
-                duration_match = re.search(r'(\d+(?:/\d+)?|\d*/\d+)$', token.rstrip(']'))
-                if duration_match:
-                    dur_str = duration_match.group(1)
-                    if '/' in dur_str:
-                        parts = dur_str.split('/')
-                        if parts[0]:
-                            duration = float(parts[0]) / float(parts[1])
-                        else:
-                            duration = 1.0 / float(parts[1])
-                    else:
-                        duration = float(dur_str)
-
-                for midi, _ in chord_notes:
-                    notes.append({
-                        'pitch': midi,
-                        'startBeat': current_beat,
-                        'lengthBeats': duration,
-                        'velocity': default_velocity
-                    })
-                current_beat += duration
-
-            else:
-                # Single note or rest
-                midi, duration = parse_abc_note(token)
-                if midi >= 0:  # Not a rest
-                    notes.append({
-                        'pitch': midi,
-                        'startBeat': current_beat,
-                        'lengthBeats': duration,
-                        'velocity': default_velocity
-                    })
-                current_beat += duration
-
+            # Chord notes all start at the same beat; a rest has no pitches
+            pitches, duration = _parse_token(token)
         except ValueError as e:
             errors.append(str(e))
+            continue
+
+        for midi in pitches:
+            notes.append({
+                'pitch': midi,
+                'startBeat': current_beat,
+                'lengthBeats': duration,
+                'velocity': default_velocity
+            })
+        current_beat += duration
 
     # Calculate bar length
     total_beats = current_beat
     bars = total_beats / beats_per_bar if beats_per_bar > 0 else total_beats
 
-    # Find next valid bar length (round up)
-    length_bars = 1.0
-    for valid in VALID_BAR_LENGTHS:
-        if valid >= bars - 0.001:  # Small epsilon for float comparison
-            length_bars = valid
-            break
-    else:
-        length_bars = VALID_BAR_LENGTHS[-1]
+    # Round up to the next power of two, within the valid range
+    length_bars = _round_up_bar_length(bars)
 
     program = {
         'lengthBars': length_bars,
@@ -423,29 +544,50 @@ def abc_to_program(abc_str: str, beats_per_bar: int = 4,
     return program, errors
 
 
+# Notes starting closer together than this are played as one chord
+CHORD_START_TOLERANCE = 0.0005
+
+
+def _start_beat(note: dict) -> float:
+    return note.get('startBeat', 0)
+
+
+def _group_by_start(notes: list[dict]) -> list[tuple[float, list[dict]]]:
+    """
+    Group notes into (start time, notes) in start order.
+
+    One stable sort, then a single pass: a note joins the current group if
+    it starts within CHORD_START_TOLERANCE of the group's first note, so
+    float noise in startBeat doesn't split a chord. A note starting where
+    the first note ends is never merged, however short that note is. The
+    window's end is computed as a sum, start + length, just as
+    abc_to_program computes the next note's start, so that case compares
+    equal instead of losing it to rounding.
+    """
+    groups = []
+    group = None
+    group_end = 0
+    for note in sorted(notes, key=_start_beat):
+        start = note.get('startBeat', 0)
+        if group is not None and start < group_end:
+            group.append(note)
+        else:
+            group = [note]
+            group_end = start + min(CHORD_START_TOLERANCE, note.get('lengthBeats', 1.0))
+            groups.append((start, group))
+    return groups
+
+
 def program_to_abc(program: dict, beats_per_bar: int = 4) -> str:
     """Convert MIDI program to ABC notation."""
     notes = program.get('notes', [])
     if not notes:
         return "z4 |"
 
-    # Group notes by start time for chords
-    by_time: dict[float, list[dict]] = {}
-    for note in notes:
-        start = note.get('startBeat', 0)
-        if start not in by_time:
-            by_time[start] = []
-        by_time[start].append(note)
-
-    # Sort by start time
-    sorted_times = sorted(by_time.keys())
-
     abc_parts = []
     notes_in_bar = 0
 
-    for start_time in sorted_times:
-        group = by_time[start_time]
-
+    for start_time, group in _group_by_start(notes):
         # Check if new bar
         bar_num = int(start_time // beats_per_bar)
         if bar_num > 0 and notes_in_bar > 0 and start_time % beats_per_bar < 0.01:
@@ -478,11 +620,7 @@ def program_to_abc(program: dict, beats_per_bar: int = 4) -> str:
     return ' '.join(abc_parts)
 
 
-def get_scale_notes(root: int, scale_name: str) -> set[int]:
-    """Get all MIDI notes in a scale across all octaves."""
-    if scale_name not in SCALES:
-        return set()
-    intervals = SCALES[scale_name]
+def _build_scale_notes(root: int, intervals: list[int]) -> frozenset[int]:
     notes = set()
     for octave in range(11):
         base = octave * 12
@@ -490,69 +628,133 @@ def get_scale_notes(root: int, scale_name: str) -> set[int]:
             note = base + (root % 12) + interval
             if 0 <= note <= 127:
                 notes.add(note)
+    return frozenset(notes)
+
+
+# Every (root, scale) pair, built once at import
+_SCALE_NOTE_SETS = {
+    (root, name): _build_scale_notes(root, intervals)
+    for root in range(12)
+    for name, intervals in SCALES.items()
+}
+
+
+def get_scale_notes(root: int, scale_name: str) -> frozenset[int]:
+    """Get all MIDI notes in a scale across all octaves."""
+    notes = _SCALE_NOTE_SETS.get((root % 12, scale_name))
+    if notes is None:
+        if scale_name not in SCALES:
+            return frozenset()
+        # Non-integer root: not in the table
+        notes = _build_scale_notes(root, SCALES[scale_name])
     return notes
 
 
-def validate_program(program: dict, key: int | None = None,
-                     scale: str | None = None,
-                     beats_per_bar: int = 4) -> tuple[list[str], list[str]]:
+def _iter_program_problems(program: dict, key: int | None = None,
+                           scale: str | None = None,
+                           beats_per_bar: int = 4) -> Iterator[tuple[str, str]]:
     """
-    Validate a MIDI program.
+    Yield ('error', message) and ('warning', message) pairs for a program.
 
-    Returns:
-        Tuple of (errors, warnings)
+    Problems come out in the order validate_program reports them, so a
+    caller can stop at the first error without walking the rest.
     """
-    errors = []
-    warnings = []
-
     length_bars = program.get('lengthBars')
     if length_bars is None:
-        errors.append("Missing 'lengthBars'")
-    elif not any(abs(length_bars - v) < 0.001 for v in VALID_BAR_LENGTHS):
-        errors.append(f"Invalid bar length {length_bars}. Must be: {VALID_BAR_LENGTHS}")
+        yield 'error', "Missing 'lengthBars'"
+    elif not _is_valid_bar_length(length_bars):
+        yield 'error', f"Invalid bar length {length_bars}. Must be: {sorted(VALID_BAR_LENGTHS)}"
 
     notes = program.get('notes', [])
     if not notes:
-        warnings.append("Empty program (will silence track)")
-        return errors, warnings
+        yield 'warning', "Empty program (will silence track)"
+        return
 
     total_beats = (length_bars or 0) * beats_per_bar
     scale_notes = get_scale_notes(key, scale) if key is not None and scale else None
+    if scale_notes:
+        outside_scale = f"Outside {NOTE_NAMES[key % 12]} {scale} scale"
+
+    # total_beats <= 0 means the end of the program isn't checked
+    end_beat = total_beats if total_beats > 0 else math.inf
 
     for i, note in enumerate(notes):
+        pitch = note.get('pitch')
+        start = note.get('startBeat')
+        length = note.get('lengthBeats')
+        velocity = note.get('velocity')
+
+        # Fast path: most notes are well formed and need no message
+        try:
+            if (type(pitch) is int and 0 <= pitch <= 127
+                    and (not scale_notes or pitch in scale_notes)
+                    and 0 <= start < end_beat and length > 0
+                    and 0 <= velocity <= 1):
+                continue
+        except TypeError:
+            pass  # Missing or non-numeric field, reported below
+
         prefix = f"Note {i}"
 
-        pitch = note.get('pitch')
         if pitch is None:
-            errors.append(f"{prefix}: Missing 'pitch'")
+            yield 'error', f"{prefix}: Missing 'pitch'"
         elif not isinstance(pitch, int) or pitch < 0 or pitch > 127:
-            errors.append(f"{prefix}: Invalid pitch {pitch}")
+            yield 'error', f"{prefix}: Invalid pitch {pitch}"
         elif scale_notes and pitch not in scale_notes:
-            warnings.append(f"{prefix} ({midi_to_note_name(pitch)}): Outside {NOTE_NAMES[key % 12]} {scale} scale")
+            yield 'warning', f"{prefix} ({midi_to_note_name(pitch)}): {outside_scale}"
 
-        start = note.get('startBeat')
         if start is None:
-            errors.append(f"{prefix}: Missing 'startBeat'")
+            yield 'error', f"{prefix}: Missing 'startBeat'"
         elif start < 0:
-            errors.append(f"{prefix}: Negative startBeat")
+            yield 'error', f"{prefix}: Negative startBeat"
         elif total_beats > 0 and start >= total_beats:
-            errors.append(f"{prefix}: Starts past program end")
+            yield 'error', f"{prefix}: Starts past program end"
 
-        length = note.get('lengthBeats')
         if length is None:
-            errors.append(f"{prefix}: Missing 'lengthBeats'")
+            yield 'error', f"{prefix}: Missing 'lengthBeats'"
         elif length <= 0:
-            errors.append(f"{prefix}: Non-positive duration")
+            yield 'error', f"{prefix}: Non-positive duration"
 
-        velocity = note.get('velocity')
         if velocity is None:
-            errors.append(f"{prefix}: Missing 'velocity'")
+            yield 'error', f"{prefix}: Missing 'velocity'"
         elif velocity < 0 or velocity > 1:
-            errors.append(f"{prefix}: Velocity must be 0.0-1.0")
+            yield 'error', f"{prefix}: Velocity must be 0.0-1.0"
 
+
+def validate_program(program: dict, key: int | None = None,
+                     scale: str | None = None,
+                     beats_per_bar: int = 4) -> tuple[list[str], list[str]]:
+    """
+    Validate a MIDI program.
+
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    errors = []
+    warnings = []
+    for kind, message in _iter_program_problems(program, key, scale, beats_per_bar):
+        (errors if kind == 'error' else warnings).append(message)
     return errors, warnings
 
 
+def validate_program_fastfail(program: dict, key: int | None = None,
+                              scale: str | None = None,
+                              beats_per_bar: int = 4) -> tuple[list[str], list[str]]:
+    """
+    Validate a MIDI program, stopping at the first error.
+
+    Returns:
+        Tuple of (errors, warnings): at most one error, and the warnings
+        found before it
+    """
+    warnings = []
+    for kind, message in _iter_program_problems(program, key, scale, beats_per_bar):
+        if kind == 'error':
+            return [message], warnings
+        warnings.append(message)
+    return [], warnings
+
+
 def validate_abc(abc_str: str, key: int | None = None,
                  scale: str | None = None,
                  beats_per_bar: int = 4) -> ValidationResult:
@@ -604,6 +806,36 @@ def validate_abc(abc_str: str, key: int | None = None,
     )
 
 
+def parse_key(key_str: str | None) -> int | None:
+    """Parse a key name (C, F#, Bb, ...) to a pitch class 0-11, or None."""
+    if not key_str:
+        return None
+    return _KEY_MAP.get(key_str[0].upper() + key_str[1:].lower())
+
+
+def validate(abc_str: str, key: str | None = None,
+             scale: str | None = None) -> dict:
+    """
+    Validate ABC given a key name, returning the dict the CLI prints.
+
+    In-process entry point for gilligan.py.
+    """
+    return validate_abc(abc_str, parse_key(key), scale).to_dict()
+
+
+def _json_codec():
+    """
+    (dumps, loads) for CLI input and output: orjson's when it is installed,
+    otherwise json's. Both dumps indent by 2, and orjson.JSONDecodeError
+    subclasses json.JSONDecodeError.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return (lambda obj: json.dumps(obj, indent=2)), json.loads
+    return (lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()), orjson.loads
+
+
 def main():
     """CLI entry point."""
     import argparse
@@ -638,23 +870,13 @@ Examples:
     else:
         input_str = sys.stdin.read()
 
-    # Parse key
-    key = None
-    if args.key:
-        key_map = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
-        key_upper = args.key.upper().replace('#', '').replace('B', '')
-        if key_upper in key_map:
-            key = key_map[key_upper]
-            if '#' in args.key:
-                key += 1
-            elif 'b' in args.key.lower():
-                key -= 1
-            key = key % 12
+    key = parse_key(args.key)
+    dumps, loads = _json_codec()
 
     # Process
     if args.json:
         try:
-            program = json.loads(input_str)
+            program = loads(input_str)
             val_errors, val_warnings = validate_program(program, key, args.scale)
             result = ValidationResult(
                 valid=len(val_errors) == 0,
@@ -681,10 +903,10 @@ Examples:
         print(result.abc_output)
     elif args.output == 'both':
         output = result.to_dict()
-        print(json.dumps(output, indent=2))
+        print(dumps(output))
     else:
         output = result.to_dict()
-        print(json.dumps(output, indent=2))
+        print(dumps(output))
 
     sys.exit(0 if result.valid else 1)
 